@@ -357,6 +357,15 @@ class StyleSheet:
         """
         self.para_styles[name] = ParagraphStyle(style)
 
+    def add_paragraph_styles(self, styles):
+        """
+        Add a group of paragraph styles to the style sheet.
+
+        :param styles: iterable of (name, :class:`.ParagraphStyle`) pairs
+        """
+        self.para_styles.update(
+            (name, ParagraphStyle(style)) for name, style in styles)
+
     def get_paragraph_style(self, name):
         """
         Return the :class:`.ParagraphStyle` associated with the name
@@ -399,6 +408,15 @@ class StyleSheet:
         """
         self.table_styles[name] = TableStyle(style)
 
+    def add_table_styles(self, styles):
+        """
+        Add a group of table styles to the style sheet.
+
+        :param styles: iterable of (name, :class:`.TableStyle`) pairs
+        """
+        self.table_styles.update(
+            (name, TableStyle(style)) for name, style in styles)
+
     def get_table_style(self, name):
         """
         Return the :class:`.TableStyle` associated with the name
@@ -420,6 +438,15 @@ class StyleSheet:
         """
         self.cell_styles[name] = TableCellStyle(style)
 
+    def add_cell_styles(self, styles):
+        """
+        Add a group of cell styles to the style sheet.
+
+        :param styles: iterable of (name, :class:`.TableCellStyle`) pairs
+        """
+        self.cell_styles.update(
+            (name, TableCellStyle(style)) for name, style in styles)
+
     def get_cell_style(self, name):
         """
         Return the :class:`.TableCellStyle` associated with the name
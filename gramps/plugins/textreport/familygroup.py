@@ -29,7 +29,7 @@
 # Python Library
 #
 #------------------------------------------------------------------------
-from functools import partial
+from collections import deque
 
 #------------------------------------------------------------------------
 #
@@ -53,6 +53,37 @@ from gramps.gen.proxy import CacheProxyDb
 from gramps.gen.errors import ReportError
 from gramps.gen.utils.db import family_name
 
+def _T_(value):  # enable deferred translations (see Python docs 22.1.3.4)
+    return value
+# _T_ is a gramps-defined keyword -- see po/update_po.py and po/genpot.sh
+
+# (option name, label, help text, default) records for the plain
+# boolean options, one tuple per section of the Include tabs
+_INCLUDE_OPTIONS = (
+    ('incParMar', _T_("Parent Marriage"),
+     _T_("Whether to include marriage information for parents."), True),
+    ('incParEvents', _T_("Parent Events"),
+     _T_("Whether to include events for parents."), False),
+    ('incParAddr', _T_("Parent Addresses"),
+     _T_("Whether to include addresses for parents."), False),
+    ('incParNotes', _T_("Parent Notes"),
+     _T_("Whether to include notes for parents."), False),
+    ('incattrs', _T_("Parent Attributes"),
+     _T_("Whether to include attributes."), False),
+    ('incParNames', _T_("Alternate Parent Names"),
+     _T_("Whether to include alternate names for parents."), False),
+    )
+
+_INCLUDE_2_OPTIONS = (
+    ('incFamNotes', _T_("Family Notes"),
+     _T_("Whether to include notes for families."), False),
+    ('incRelDates', _T_("Dates of Relatives"),
+     _T_("Whether to include dates for relatives "
+         "(father, mother, spouse)."), False),
+    ('incChiMar', _T_("Children Marriages"),
+     _T_("Whether to include marriage information for children."), True),
+    )
+
 #------------------------------------------------------------------------
 #
 # FamilyGroup
@@ -89,6 +120,27 @@ class FamilyGroup(Report):
 
         self.set_locale(menu.get_option_by_name('trans').get_value())
         self._ = self._locale.translation.sgettext # needed for English
+        # translators: needed for French, ignore otherwise
+        self._detail_fmt = self._("%(str1)s: %(str2)s")
+        # row labels, translated once instead of once per row
+        self._labels = {
+            'Father' : self._("Father"),
+            'Mother' : self._("Mother"),
+            'Birth' : self._("Birth"),
+            'Death' : self._("Death"),
+            'Spouse' : self._("Spouse"),
+            'Marriage' : self._("Marriage"),
+            'Note' : self._("Note"),
+            'Address' : self._("Address"),
+            'Husband' : self._("Husband"),
+            'Wife' : self._("Wife"),
+            'Children' : self._("Children"),
+            }
+        self._gender_acronyms = {
+            Person.MALE : self._("acronym for male|M"),
+            Person.FEMALE : self._("acronym for female|F"),
+            }
+        self._unknown_gender_fmt = self._("acronym for unknown|%dU")
 
         stdoptions.run_date_format_option(self, menu)
 
@@ -97,86 +149,227 @@ class FamilyGroup(Report):
         self.database = CacheProxyDb(self.database)
         self.db = self.database
 
+        # per-family prefetch caches, filled by _prefetch_family
+        self._ev_cache = {}
+        self._pers_cache = {}
+        self._note_cache = {}
+        # memoized display names and translated type strings; the
+        # standard event types are pre-translated, custom types join
+        # the cache as they are first seen
+        self._name_cache = {}
+        self._type_cache = {xml_str: self._(xml_str)
+                            for xml_str in EventType().get_standard_xml()}
+        self._bd_cache = {}
+
         self.filter = menu.get_option_by_name('filter').get_filter()
 
         get_option_by_name = menu.get_option_by_name
-        get_value = lambda name: get_option_by_name(name).get_value()
-        self.gramps_ids = get_value('inc_id')
-        self.recursive = get_value('recursive')
-        self.missing_info = get_value('missinginfo')
-        self.generations = get_value('generations')
-        self.inc_fam_notes = get_value('incFamNotes')
-        self.inc_par_events = get_value('incParEvents')
-        self.inc_par_addr = get_value('incParAddr')
-        self.inc_par_notes = get_value('incParNotes')
-        self.inc_par_names = get_value('incParNames')
-        self.inc_par_mar = get_value('incParMar')
-        self.inc_rel_dates = get_value('incRelDates')
-        self.inc_chi_mar = get_value('incChiMar')
-        self.include_attrs = get_value('incattrs')
+        opts = {name: get_option_by_name(name).get_value()
+                for name in ('inc_id', 'recursive', 'missinginfo',
+                             'generations', 'incFamNotes', 'incParEvents',
+                             'incParAddr', 'incParNotes', 'incParNames',
+                             'incParMar', 'incRelDates', 'incChiMar',
+                             'incattrs')}
+        self.gramps_ids = opts['inc_id']
+        self.recursive = opts['recursive']
+        self.missing_info = opts['missinginfo']
+        self.generations = opts['generations']
+        self.inc_fam_notes = opts['incFamNotes']
+        self.inc_par_events = opts['incParEvents']
+        self.inc_par_addr = opts['incParAddr']
+        self.inc_par_notes = opts['incParNotes']
+        self.inc_par_names = opts['incParNames']
+        self.inc_par_mar = opts['incParMar']
+        self.inc_rel_dates = opts['incRelDates']
+        self.inc_chi_mar = opts['incChiMar']
+        self.include_attrs = opts['incattrs']
 
         stdoptions.run_name_format_option(self, menu)
 
         self.place_format = menu.get_option_by_name("place_format").get_value()
 
+    def _prefetch_family(self, family):
+        """
+        Load the people, events and notes referenced by a family into
+        the local caches, one bulk fetch per object type, so that the
+        dump_* methods do not have to go back to the database once per
+        handle while the tables are being written.
+        """
+        event_handles = {event_ref.ref
+                         for event_ref in family.get_event_ref_list()
+                         if event_ref}
+        note_handles = set(family.get_note_list())
+        person_handles = {child_ref.ref
+                          for child_ref in family.get_child_ref_list()}
+        for handle in (family.get_father_handle(),
+                       family.get_mother_handle()):
+            if handle:
+                person_handles.add(handle)
+
+        self._pers_cache.update(
+            {handle: self.db.get_person_from_handle(handle)
+             for handle in person_handles
+             if handle not in self._pers_cache})
+
+        for handle in person_handles:
+            person = self._pers_cache[handle]
+            for event_ref in person.get_primary_event_ref_list():
+                event_handles.add(event_ref.ref)
+            for event_ref in (person.get_birth_ref(),
+                              person.get_death_ref()):
+                if event_ref:
+                    event_handles.add(event_ref.ref)
+            note_handles.update(person.get_note_list())
+
+        self._ev_cache.update(
+            {handle: self.db.get_event_from_handle(handle)
+             for handle in event_handles
+             if handle not in self._ev_cache})
+        self._note_cache.update(
+            {handle: self.db.get_note_from_handle(handle)
+             for handle in note_handles
+             if handle not in self._note_cache})
+
+    def _get_event(self, handle):
+        """ Get an event from the prefetch cache, loading it on a miss. """
+        event = self._ev_cache.get(handle)
+        if event is None:
+            event = self._ev_cache[handle] = \
+                self.db.get_event_from_handle(handle)
+        return event
+
+    def _get_person(self, handle):
+        """ Get a person from the prefetch cache, loading it on a miss. """
+        person = self._pers_cache.get(handle)
+        if person is None:
+            person = self._pers_cache[handle] = \
+                self.db.get_person_from_handle(handle)
+        return person
+
+    def _format_name(self, person):
+        """
+        Return the display name of a person, formatting each person at
+        most once.  In a recursive run the same person shows up as a
+        child and again as a parent of a sub-family.
+        """
+        handle = person.get_handle()
+        if not handle:
+            return self._name_display.display(person)
+        name = self._name_cache.get(handle)
+        if name is None:
+            name = self._name_cache[handle] = \
+                self._name_display.display(person)
+        return name
+
+    def _trans_type(self, gtype):
+        """
+        Return the translated string of an event, attribute or name
+        type, translating each distinct type only once.
+        """
+        type_str = self._get_type(gtype)
+        trans = self._type_cache.get(type_str)
+        if trans is None:
+            trans = self._type_cache[type_str] = self._(type_str)
+        return trans
+
+    def _birth_death_str(self, person):
+        """
+        Return (birth_date, death_date, has_either) for a person,
+        formatting the two dates at most once per person.  The dates
+        default to two spaces so a missing one still pads the
+        "(birth - death)" suffix the way the old code did.
+        """
+        handle = person.get_handle()
+        result = self._bd_cache.get(handle)
+        if result is None:
+            birth_ref = person.get_birth_ref()
+            birth = "  "
+            if birth_ref:
+                event = self._get_event(birth_ref.ref)
+                birth = self._get_date(event.get_date_object())
+            death_ref = person.get_death_ref()
+            death = "  "
+            if death_ref:
+                event = self._get_event(death_ref.ref)
+                death = self._get_date(event.get_date_object())
+            result = (birth, death, bool(birth_ref or death_ref))
+            self._bd_cache[handle] = result
+        return result
+
+    def _get_note(self, handle):
+        """ Get a note from the prefetch cache, loading it on a miss. """
+        note = self._note_cache.get(handle)
+        if note is None:
+            note = self._note_cache[handle] = \
+                self.db.get_note_from_handle(handle)
+        return note
+
+    def _cell(self, cell_style, text, span=1, mark=None, para='FGR-Normal'):
+        """
+        Write one table cell holding a single paragraph, batching the
+        doc calls that every cell repeats.  Pass None for text to leave
+        the paragraph empty.
+        """
+        doc = self.doc
+        doc.start_cell(cell_style, span)
+        doc.start_paragraph(para)
+        if text is not None:
+            doc.write_text(text, mark)
+        doc.end_paragraph()
+        doc.end_cell()
+
+    def _empty_event_row(self, name):
+        """ Emit a missing-information row: a label and two blank cells. """
+        doc = self.doc
+        doc.start_row()
+        self._cell("FGR-TextContents", name)
+        self._cell("FGR-TextContents", "")
+        self._cell("FGR-TextContentsEnd", "")
+        doc.end_row()
+
     def dump_parent_event(self, name, event):
+        if event is None:
+            self._empty_event_row(name)
+            return
+        doc = self.doc
         place = ""
-        date = ""
-        descr = ""
-        if event:
-            date = self._get_date(event.get_date_object())
+        date = self._get_date(event.get_date_object())
+        if event.get_place_handle():
             place = _pd.display_event(self.db, event, self.place_format)
             if place is None:
                 place = ''
-            descr = event.get_description()
+        descr = event.get_description()
 
-            if self.include_attrs:
-                for attr in event.get_attribute_list():
-                    if descr:
-                        # translators: needed for Arabic, ignore otherwise
-                        descr += self._("; ")
-                    attr_type = self._get_type(attr.get_type())
-                    # translators: needed for French, ignore otherwise
-                    descr += self._("%(str1)s: %(str2)s"
-                                   ) % {'str1' : self._(attr_type),
-                                        'str2' : attr.get_value()}
-
-        self.doc.start_row()
-        self.doc.start_cell("FGR-TextContents")
-        self.doc.start_paragraph('FGR-Normal')
-        self.doc.write_text(name)
-        self.doc.end_paragraph()
-        self.doc.end_cell()
+        if self.include_attrs:
+            attr_list = event.get_attribute_list()
+            if attr_list:
+                parts = [descr] if descr else []
+                for attr in attr_list:
+                    attr_type = self._trans_type(attr.get_type())
+                    parts.append(
+                        self._detail_fmt % {'str1' : attr_type,
+                                            'str2' : attr.get_value()})
+                # translators: needed for Arabic, ignore otherwise
+                descr = self._("; ").join(parts)
+
+        doc.start_row()
+        self._cell("FGR-TextContents", name)
 
         if descr:
-            self.doc.start_cell("FGR-TextContentsEnd", 2)
-            self.doc.start_paragraph('FGR-Normal')
-            self.doc.write_text(descr)
-            self.doc.end_paragraph()
-            self.doc.end_cell()
-            self.doc.end_row()
+            self._cell("FGR-TextContentsEnd", descr, span=2)
+            doc.end_row()
 
             if date or place:
-                self.doc.start_row()
-                self.doc.start_cell("FGR-TextContents")
-                self.doc.start_paragraph('FGR-Normal')
-                self.doc.end_paragraph()
-                self.doc.end_cell()
+                doc.start_row()
+                self._cell("FGR-TextContents", None)
 
         if (date or place) or not descr:
-            self.doc.start_cell("FGR-TextContents")
-            self.doc.start_paragraph('FGR-Normal')
-            self.doc.write_text(date)
-            self.doc.end_paragraph()
-            self.doc.end_cell()
-            self.doc.start_cell("FGR-TextContentsEnd")
-            self.doc.start_paragraph('FGR-Normal')
-            self.doc.write_text(place)
-            self.doc.end_paragraph()
-            self.doc.end_cell()
-            self.doc.end_row()
+            self._cell("FGR-TextContents", date)
+            self._cell("FGR-TextContentsEnd", place)
+            doc.end_row()
 
     def dump_parent_parents(self, person):
+        doc = self.doc
         family_handle = person.get_main_parents_family_handle()
         father_name = ""
         mother_name = ""
@@ -184,150 +377,104 @@ class FamilyGroup(Report):
             family = self.db.get_family_from_handle(family_handle)
             father_handle = family.get_father_handle()
             if father_handle:
-                father = self.db.get_person_from_handle(father_handle)
-                father_name = self._name_display.display(father)
+                father = self._get_person(father_handle)
+                father_name = self._format_name(father)
                 if self.gramps_ids:
                     gid = father.get_gramps_id()
                     if gid:
-                        father_name += " (%s)" % gid
+                        father_name += f" ({gid})"
                 if self.inc_rel_dates:
-                    birth_ref = father.get_birth_ref()
-                    birth = "  "
-                    if birth_ref:
-                        event = self.db.get_event_from_handle(birth_ref.ref)
-                        birth = self._get_date(event.get_date_object())
-                    death_ref = father.get_death_ref()
-                    death = "  "
-                    if death_ref:
-                        event = self.db.get_event_from_handle(death_ref.ref)
-                        death = self._get_date(event.get_date_object())
-                    if birth_ref or death_ref:
-                        father_name += " (%s - %s)" % (birth, death)
+                    birth, death, has_dates = self._birth_death_str(father)
+                    if has_dates:
+                        father_name += f" ({birth} - {death})"
             mother_handle = family.get_mother_handle()
             if mother_handle:
-                mother = self.db.get_person_from_handle(mother_handle)
-                mother_name = self._name_display.display(mother)
+                mother = self._get_person(mother_handle)
+                mother_name = self._format_name(mother)
                 if self.gramps_ids:
                     gid = mother.get_gramps_id()
                     if gid:
-                        mother_name += " (%s)" % gid
+                        mother_name += f" ({gid})"
                 if self.inc_rel_dates:
-                    birth_ref = mother.get_birth_ref()
-                    birth = "  "
-                    if birth_ref:
-                        event = self.db.get_event_from_handle(birth_ref.ref)
-                        birth = self._get_date(event.get_date_object())
-                    death_ref = mother.get_death_ref()
-                    death = "  "
-                    if death_ref:
-                        event = self.db.get_event_from_handle(death_ref.ref)
-                        death = self._get_date(event.get_date_object())
-                    if birth_ref or death_ref:
-                        mother_name += " (%s - %s)" % (birth, death)
+                    birth, death, has_dates = self._birth_death_str(mother)
+                    if has_dates:
+                        mother_name += f" ({birth} - {death})"
 
         if father_name != "":
-            self.doc.start_row()
-            self.doc.start_cell("FGR-TextContents")
-            self.doc.start_paragraph('FGR-Normal')
-            self.doc.write_text(self._("Father"))
-            self.doc.end_paragraph()
-            self.doc.end_cell()
-            self.doc.start_cell("FGR-TextContentsEnd", 2)
-            self.doc.start_paragraph('FGR-Normal')
+            doc.start_row()
+            self._cell("FGR-TextContents", self._labels['Father'])
             mark = utils.get_person_mark(self.db, father)
-            self.doc.write_text(father_name, mark)
-            self.doc.end_paragraph()
-            self.doc.end_cell()
-            self.doc.end_row()
+            self._cell("FGR-TextContentsEnd", father_name, span=2, mark=mark)
+            doc.end_row()
         elif self.missing_info:
-            self.dump_parent_line(self._("Father"), "")
+            self.dump_parent_line(self._labels['Father'], "")
 
         if mother_name != "":
-            self.doc.start_row()
-            self.doc.start_cell("FGR-TextContents")
-            self.doc.start_paragraph('FGR-Normal')
-            self.doc.write_text(self._("Mother"))
-            self.doc.end_paragraph()
-            self.doc.end_cell()
-            self.doc.start_cell("FGR-TextContentsEnd", 2)
-            self.doc.start_paragraph('FGR-Normal')
+            doc.start_row()
+            self._cell("FGR-TextContents", self._labels['Mother'])
             mark = utils.get_person_mark(self.db, mother)
-            self.doc.write_text(mother_name, mark)
-            self.doc.end_paragraph()
-            self.doc.end_cell()
-            self.doc.end_row()
+            self._cell("FGR-TextContentsEnd", mother_name, span=2, mark=mark)
+            doc.end_row()
         elif self.missing_info:
-            self.dump_parent_line(self._("Mother"), "")
+            self.dump_parent_line(self._labels['Mother'], "")
 
     def dump_parent_line(self, name, text):
-        self.doc.start_row()
-        self.doc.start_cell("FGR-TextContents")
-        self.doc.start_paragraph('FGR-Normal')
-        self.doc.write_text(name)
-        self.doc.end_paragraph()
-        self.doc.end_cell()
-        self.doc.start_cell("FGR-TextContentsEnd", 2)
-        self.doc.start_paragraph('FGR-Normal')
-        self.doc.write_text(text)
-        self.doc.end_paragraph()
-        self.doc.end_cell()
-        self.doc.end_row()
+        doc = self.doc
+        doc.start_row()
+        self._cell("FGR-TextContents", name)
+        self._cell("FGR-TextContentsEnd", text, span=2)
+        doc.end_row()
 
     def dump_parent_noteline(self, name, note):
-        self.doc.start_row()
-        self.doc.start_cell("FGR-TextContents")
-        self.doc.start_paragraph('FGR-Normal')
-        self.doc.write_text(name)
-        self.doc.end_paragraph()
-        self.doc.end_cell()
-        self.doc.start_cell("FGR-TextContentsEnd", 2)
-        self.doc.write_styled_note(
+        doc = self.doc
+        doc.start_row()
+        self._cell("FGR-TextContents", name)
+        doc.start_cell("FGR-TextContentsEnd", 2)
+        doc.write_styled_note(
             note.get_styledtext(), note.get_format(), 'FGR-Note',
             contains_html=(note.get_type() == NoteType.HTML_CODE))
-        self.doc.end_cell()
-        self.doc.end_row()
+        doc.end_cell()
+        doc.end_row()
 
     def dump_parent(self, title, person_handle):
-
+        doc = self.doc
         if not person_handle and not self.missing_info:
             return
         elif not person_handle:
             person = Person()
         else:
-            person = self.db.get_person_from_handle(person_handle)
-        name = self._name_display.display(person)
+            person = self._get_person(person_handle)
+        name = self._format_name(person)
 
-        self.doc.start_table(title, 'FGR-ParentTable')
-        self.doc.start_row()
-        self.doc.start_cell('FGR-ParentHead', 3)
-        self.doc.start_paragraph('FGR-ParentName')
+        doc.start_table(title, 'FGR-ParentTable')
+        doc.start_row()
+        doc.start_cell('FGR-ParentHead', 3)
+        doc.start_paragraph('FGR-ParentName')
         mark = utils.get_person_mark(self.db, person)
-        # translators: needed for French, ignore otherwise
-        self.doc.write_text(self._("%(str1)s: %(str2)s"
-                                  ) % {'str1' : title,
-                                       'str2' : name},
-                            mark)
+        doc.write_text(self._detail_fmt % {'str1' : title,
+                                           'str2' : name},
+                       mark)
         if self.gramps_ids:
             gid = person.get_gramps_id()
             if gid:
-                self.doc.write_text(" (%s)" % gid)
-        self.doc.end_paragraph()
-        self.doc.end_cell()
-        self.doc.end_row()
+                doc.write_text(f" ({gid})")
+        doc.end_paragraph()
+        doc.end_cell()
+        doc.end_row()
 
         birth_ref = person.get_birth_ref()
         birth = None
-        ev_name = self._("Birth")
+        ev_name = self._labels['Birth']
         if birth_ref:
-            birth = self.db.get_event_from_handle(birth_ref.ref)
+            birth = self._get_event(birth_ref.ref)
         if birth or self.missing_info:
             self.dump_parent_event(ev_name, birth)
 
         death_ref = person.get_death_ref()
         death = None
-        ev_name = self._("Death")
+        ev_name = self._labels['Death']
         if death_ref:
-            death = self.db.get_event_from_handle(death_ref.ref)
+            death = self._get_event(death_ref.ref)
         if death or self.missing_info:
             self.dump_parent_event(ev_name, death)
 
@@ -336,104 +483,87 @@ class FamilyGroup(Report):
         if self.inc_par_events:
             for event_ref in person.get_primary_event_ref_list():
                 if event_ref != birth_ref and event_ref != death_ref:
-                    event = self.db.get_event_from_handle(event_ref.ref)
-                    event_type = self._get_type(event.get_type())
-                    self.dump_parent_event(self._(event_type), event)
+                    event = self._get_event(event_ref.ref)
+                    event_type = self._trans_type(event.get_type())
+                    self.dump_parent_event(event_type, event)
 
         if self.inc_par_addr:
-            addrlist = person.get_address_list()[:]
-            for addr in addrlist:
+            for addr in person.get_address_list():
                 location = utils.get_address_str(addr)
                 date = self._get_date(addr.get_date_object())
 
-                self.doc.start_row()
-                self.doc.start_cell("FGR-TextContents")
-                self.doc.start_paragraph('FGR-Normal')
-                self.doc.write_text(self._("Address"))
-                self.doc.end_paragraph()
-                self.doc.end_cell()
-                self.doc.start_cell("FGR-TextContents")
-                self.doc.start_paragraph('FGR-Normal')
-                self.doc.write_text(date)
-                self.doc.end_paragraph()
-                self.doc.end_cell()
-                self.doc.start_cell("FGR-TextContentsEnd")
-                self.doc.start_paragraph('FGR-Normal')
-                self.doc.write_text(location)
-                self.doc.end_paragraph()
-                self.doc.end_cell()
-                self.doc.end_row()
+                doc.start_row()
+                self._cell("FGR-TextContents", self._labels['Address'])
+                self._cell("FGR-TextContents", date)
+                self._cell("FGR-TextContentsEnd", location)
+                doc.end_row()
 
         if self.inc_par_notes:
             for notehandle in person.get_note_list():
-                note = self.db.get_note_from_handle(notehandle)
-                self.dump_parent_noteline(self._("Note"), note)
+                note = self._get_note(notehandle)
+                self.dump_parent_noteline(self._labels['Note'], note)
 
         if self.include_attrs:
             for attr in person.get_attribute_list():
-                attr_type = self._get_type(attr.get_type())
-                self.dump_parent_line(self._(attr_type), attr.get_value())
+                attr_type = self._trans_type(attr.get_type())
+                self.dump_parent_line(attr_type, attr.get_value())
 
         if self.inc_par_names:
             for alt_name in person.get_alternate_names():
-                name_type = self._get_type(alt_name.get_type())
+                name_type = self._trans_type(alt_name.get_type())
                 name = self._name_display.display_name(alt_name)
-                self.dump_parent_line(self._(name_type), name)
+                self.dump_parent_line(name_type, name)
 
-        self.doc.end_table()
+        doc.end_table()
 
     def dump_marriage(self, family):
-
+        doc = self.doc
         if not family:
             return
 
         mrg = None
         family_list = family.get_event_ref_list()
-        for event_ref in family_list:
-            if event_ref:
-                event = self.db.get_event_from_handle(event_ref.ref)
-                if (event.get_type() == EventType.MARRIAGE and
-                        (event_ref.get_role() == EventRoleType.FAMILY or
-                         event_ref.get_role() == EventRoleType.PRIMARY)):
-                    mrg = event
-                    break
+        events = [(event_ref, self._get_event(event_ref.ref))
+                  for event_ref in family_list if event_ref]
+        for event_ref, event in events:
+            if (event.get_type() == EventType.MARRIAGE and
+                    (event_ref.get_role() == EventRoleType.FAMILY or
+                     event_ref.get_role() == EventRoleType.PRIMARY)):
+                mrg = event
+                break
 
         if len(family_list) > 0 or self.missing_info or self.include_attrs:
-            self.doc.start_table("MarriageInfo", 'FGR-ParentTable')
-            self.doc.start_row()
-            self.doc.start_cell('FGR-ParentHead', 3)
-            self.doc.start_paragraph('FGR-ParentName')
-            header = self._("Marriage")
+            doc.start_table("MarriageInfo", 'FGR-ParentTable')
+            doc.start_row()
+            header = self._labels['Marriage']
             if self.gramps_ids:
-                header += " (%s)" % family.get_gramps_id()
+                header += f" ({family.get_gramps_id()})"
             # translators: needed for French, ignore otherwise
-            self.doc.write_text(self._("%s:") % header)
-            self.doc.end_paragraph()
-            self.doc.end_cell()
-            self.doc.end_row()
+            self._cell('FGR-ParentHead', self._("%s:") % header, span=3,
+                       para='FGR-ParentName')
+            doc.end_row()
 
-            self.dump_parent_event(self._("Marriage"), mrg)
+            self.dump_parent_event(self._labels['Marriage'], mrg)
 
-            for event_ref in family_list:
-                if event_ref:
-                    event = self.db.get_event_from_handle(event_ref.ref)
-                    if event.get_type() != EventType.MARRIAGE:
-                        event_type = self._get_type(event.get_type())
-                        self.dump_parent_event(self._(event_type), event)
+            for dummy, event in events:
+                if event.get_type() != EventType.MARRIAGE:
+                    event_type = self._trans_type(event.get_type())
+                    self.dump_parent_event(event_type, event)
 
             if self.include_attrs:
                 for attr in family.get_attribute_list():
-                    attr_type = self._get_type(attr.get_type())
-                    self.dump_parent_line(self._(attr_type), attr.get_value())
+                    attr_type = self._trans_type(attr.get_type())
+                    self.dump_parent_line(attr_type, attr.get_value())
 
             if self.inc_fam_notes:
                 for notehandle in family.get_note_list():
-                    note = self.database.get_note_from_handle(notehandle)
-                    self.dump_parent_noteline(self._("Note"), note)
+                    note = self._get_note(notehandle)
+                    self.dump_parent_noteline(self._labels['Note'], note)
 
-            self.doc.end_table()
+            doc.end_table()
 
     def dump_child_event(self, text, name, event):
+        doc = self.doc
         date = ""
         place = ""
         if event:
@@ -444,224 +574,221 @@ class FamilyGroup(Report):
                 if place is None:
                     place = ''
 
-        self.doc.start_row()
-        self.doc.start_cell(text)
-        self.doc.start_paragraph('FGR-Normal')
-        self.doc.end_paragraph()
-        self.doc.end_cell()
-        self.doc.start_cell('FGR-TextContents')
-        self.doc.start_paragraph('FGR-Normal')
-        self.doc.write_text(name)
-        self.doc.end_paragraph()
-        self.doc.end_cell()
-        self.doc.start_cell('FGR-TextContents')
-        self.doc.start_paragraph('FGR-Normal')
-        self.doc.write_text(date)
-        self.doc.end_paragraph()
-        self.doc.end_cell()
-        self.doc.start_cell('FGR-TextContentsEnd')
-        self.doc.start_paragraph('FGR-Normal')
-        self.doc.write_text(place)
-        self.doc.end_paragraph()
-        self.doc.end_cell()
-        self.doc.end_row()
+        doc.start_row()
+        self._cell(text, None)
+        self._cell('FGR-TextContents', name)
+        self._cell('FGR-TextContents', date)
+        self._cell('FGR-TextContentsEnd', place)
+        doc.end_row()
 
     def dump_child(self, index, person_handle):
-
-        person = self.db.get_person_from_handle(person_handle)
+        doc = self.doc
+        person = self._get_person(person_handle)
         families = len(person.get_family_handle_list())
         birth_ref = person.get_birth_ref()
         if birth_ref:
-            birth = self.db.get_event_from_handle(birth_ref.ref)
+            birth = self._get_event(birth_ref.ref)
         else:
             birth = None
         death_ref = person.get_death_ref()
         if death_ref:
-            death = self.db.get_event_from_handle(death_ref.ref)
+            death = self._get_event(death_ref.ref)
         else:
             death = None
 
-        spouse_count = 0
+        fam_info = []
         if self.inc_chi_mar:
             for family_handle in person.get_family_handle_list():
                 family = self.db.get_family_from_handle(family_handle)
-                spouse_id = None
                 if person_handle == family.get_father_handle():
                     spouse_id = family.get_mother_handle()
                 else:
                     spouse_id = family.get_father_handle()
-                if spouse_id:
-                    spouse_count += 1
+                mrg = None
+                for event_ref in family.get_event_ref_list():
+                    if event_ref:
+                        event = self._get_event(event_ref.ref)
+                        if event.type == EventType.MARRIAGE:
+                            mrg = event
+                            break
+                fam_info.append((family, spouse_id, mrg))
+        spouse_count = sum(1 for (dummy, spouse_id, dummy2) in fam_info
+                           if spouse_id)
 
-        self.doc.start_row()
+        doc.start_row()
         if (spouse_count != 0
                 or self.missing_info
                 or death is not None
                 or birth is not None):
-            self.doc.start_cell('FGR-TextChild1')
+            doc.start_cell('FGR-TextChild1')
         else:
-            self.doc.start_cell('FGR-TextChild2')
-        self.doc.start_paragraph('FGR-ChildText')
-        index_str = ("%d" % index)
-        if person.get_gender() == Person.MALE:
-            self.doc.write_text(index_str + self._("acronym for male|M"))
-        elif person.get_gender() == Person.FEMALE:
-            self.doc.write_text(index_str + self._("acronym for female|F"))
+            doc.start_cell('FGR-TextChild2')
+        doc.start_paragraph('FGR-ChildText')
+        acronym = self._gender_acronyms.get(person.get_gender())
+        if acronym is not None:
+            doc.write_text(f"{index}{acronym}")
         else:
-            self.doc.write_text(self._("acronym for unknown|%dU") % index)
-        self.doc.end_paragraph()
-        self.doc.end_cell()
+            doc.write_text(self._unknown_gender_fmt % index)
+        doc.end_paragraph()
+        doc.end_cell()
 
-        name = self._name_display.display(person)
+        name = self._format_name(person)
         mark = utils.get_person_mark(self.db, person)
-        self.doc.start_cell('FGR-ChildName', 3)
-        self.doc.start_paragraph('FGR-ChildText')
-        self.doc.write_text(name, mark)
+        doc.start_cell('FGR-ChildName', 3)
+        doc.start_paragraph('FGR-ChildText')
+        doc.write_text(name, mark)
         if self.gramps_ids:
-            self.doc.write_text(" (%s)" % person.get_gramps_id())
-        self.doc.end_paragraph()
-        self.doc.end_cell()
-        self.doc.end_row()
+            doc.write_text(f" ({person.get_gramps_id()})")
+        doc.end_paragraph()
+        doc.end_cell()
+        doc.end_row()
 
         if self.missing_info or birth is not None:
             if spouse_count != 0 or self.missing_info or death is not None:
-                self.dump_child_event('FGR-TextChild1', self._('Birth'), birth)
+                self.dump_child_event('FGR-TextChild1',
+                                      self._labels['Birth'], birth)
             else:
-                self.dump_child_event('FGR-TextChild2', self._('Birth'), birth)
+                self.dump_child_event('FGR-TextChild2',
+                                      self._labels['Birth'], birth)
 
         if self.missing_info or death is not None:
             if spouse_count == 0 or not self.inc_chi_mar:
-                self.dump_child_event('FGR-TextChild2', self._('Death'), death)
+                self.dump_child_event('FGR-TextChild2',
+                                      self._labels['Death'], death)
             else:
-                self.dump_child_event('FGR-TextChild1', self._('Death'), death)
+                self.dump_child_event('FGR-TextChild1',
+                                      self._labels['Death'], death)
 
         if self.inc_chi_mar:
             index = 0
-            for family_handle in person.get_family_handle_list():
-                mrg = None
+            for family, spouse_id, mrg in fam_info:
                 index += 1
-                family = self.db.get_family_from_handle(family_handle)
-
-                for event_ref in family.get_event_ref_list():
-                    if event_ref:
-                        event = self.db.get_event_from_handle(event_ref.ref)
-                        if event.type == EventType.MARRIAGE:
-                            mrg = event
-                            break
-
-                spouse_id = None
-
-                if person_handle == family.get_father_handle():
-                    spouse_id = family.get_mother_handle()
-                else:
-                    spouse_id = family.get_father_handle()
 
                 if spouse_id:
-                    self.doc.start_row()
+                    doc.start_row()
                     if mrg or index != families:
-                        self.doc.start_cell('FGR-TextChild1')
+                        doc.start_cell('FGR-TextChild1')
                     else:
-                        self.doc.start_cell('FGR-TextChild2')
-                    self.doc.start_paragraph('FGR-Normal')
-                    self.doc.end_paragraph()
-                    self.doc.end_cell()
-                    self.doc.start_cell('FGR-TextContents')
-                    self.doc.start_paragraph('FGR-Normal')
-                    self.doc.write_text(self._("Spouse"))
-                    self.doc.end_paragraph()
-                    self.doc.end_cell()
-                    self.doc.start_cell('FGR-TextContentsEnd', 2)
-                    self.doc.start_paragraph('FGR-Normal')
-
-                    spouse = self.db.get_person_from_handle(spouse_id)
-                    spouse_name = self._name_display.display(spouse)
+                        doc.start_cell('FGR-TextChild2')
+                    doc.start_paragraph('FGR-Normal')
+                    doc.end_paragraph()
+                    doc.end_cell()
+                    doc.start_cell('FGR-TextContents')
+                    doc.start_paragraph('FGR-Normal')
+                    doc.write_text(self._labels['Spouse'])
+                    doc.end_paragraph()
+                    doc.end_cell()
+                    doc.start_cell('FGR-TextContentsEnd', 2)
+                    doc.start_paragraph('FGR-Normal')
+
+                    spouse = self._get_person(spouse_id)
+                    spouse_name = self._format_name(spouse)
                     if self.gramps_ids:
                         gid = spouse.get_gramps_id()
                         if gid:
-                            spouse_name += " (%s)" % gid
+                            spouse_name += f" ({gid})"
                     if self.inc_rel_dates:
-                        birth = "  "
-                        birth_ref = spouse.get_birth_ref()
-                        if birth_ref:
-                            event = self.db.get_event_from_handle(birth_ref.ref)
-                            birth = self._get_date(event.get_date_object())
-                        death = "  "
-                        death_ref = spouse.get_death_ref()
-                        if death_ref:
-                            event = self.db.get_event_from_handle(death_ref.ref)
-                            death = self._get_date(event.get_date_object())
-                        if birth_ref or death_ref:
-                            spouse_name += " (%s - %s)" % (birth, death)
+                        birth, death, has_dates = \
+                            self._birth_death_str(spouse)
+                        if has_dates:
+                            spouse_name += f" ({birth} - {death})"
                     if self.gramps_ids:
                         fid = family.get_gramps_id()
                         if fid:
-                            spouse_name += " (%s)" % fid
+                            spouse_name += f" ({fid})"
                     mark = utils.get_person_mark(self.db, spouse)
-                    self.doc.write_text(spouse_name, mark)
-                    self.doc.end_paragraph()
-                    self.doc.end_cell()
-                    self.doc.end_row()
+                    doc.write_text(spouse_name, mark)
+                    doc.end_paragraph()
+                    doc.end_cell()
+                    doc.end_row()
 
                 if mrg:
-                    ev_name = self._("Marriage")
+                    ev_name = self._labels['Marriage']
                     if index == families:
                         self.dump_child_event('FGR-TextChild2', ev_name, mrg)
                     else:
                         self.dump_child_event('FGR-TextChild1', ev_name, mrg)
 
+    def _dump_children_header(self):
+        """ Start the children table and write its fixed header row. """
+        doc = self.doc
+        doc.start_table('FGR-Children', 'FGR-ChildTable')
+        doc.start_row()
+        self._cell('FGR-ParentHead', self._labels['Children'], span=4,
+                   para='FGR-ParentName')
+        doc.end_row()
+
     def dump_family(self, family_handle, generation):
-        family = self.db.get_family_from_handle(family_handle)
+        """
+        Write the page for a family and, with the recursive option, for
+        all its descendant families.  The descent is driven by an
+        explicit queue rather than recursion, so each family's objects
+        are prefetched generation by generation as the queue drains.
+        """
+        queue = deque([(family_handle, generation)])
+        queued = {family_handle}
+        first_page = True
+        while queue:
+            family_handle, generation = queue.popleft()
+            if not first_page:
+                self.doc.page_break()
+            first_page = False
+            family = self.db.get_family_from_handle(family_handle)
+            self._prefetch_family(family)
+            self._dump_family_page(family, generation)
+
+            if self.recursive:
+                for child_ref in family.get_child_ref_list():
+                    # already loaded by the prefetch above
+                    child = self._get_person(child_ref.ref)
+                    for child_family_handle in \
+                            child.get_family_handle_list():
+                        if child_family_handle not in queued:
+                            queued.add(child_family_handle)
+                            queue.append((child_family_handle,
+                                          generation + 1))
+
+    def _dump_family_page(self, family, generation):
+        """ Write the tables for a single family. """
+        doc = self.doc
         family_toc_name = family_name(family, self.db)
 
-        self.doc.start_paragraph('FGR-Title')
+        doc.start_paragraph('FGR-Title')
         if self.recursive and self.generations:
             title = self._("Family Group Report - Generation %d") % generation
         else:
             title = self._("Family Group Report")
         mark = IndexMark(title, INDEX_TYPE_TOC, 1)
-        self.doc.write_text(title, mark)
+        doc.write_text(title, mark)
         mark = IndexMark(family_toc_name, INDEX_TYPE_TOC, 2)
-        self.doc.write_text('', mark)
-        self.doc.end_paragraph()
+        doc.write_text('', mark)
+        doc.end_paragraph()
 
-        self.dump_parent(self._("Husband"), family.get_father_handle())
-        self.doc.start_paragraph("FGR-blank")
-        self.doc.end_paragraph()
+        self.dump_parent(self._labels['Husband'], family.get_father_handle())
+        doc.start_paragraph("FGR-blank")
+        doc.end_paragraph()
 
         if self.inc_par_mar:
             self.dump_marriage(family)
-            self.doc.start_paragraph("FGR-blank")
-            self.doc.end_paragraph()
+            doc.start_paragraph("FGR-blank")
+            doc.end_paragraph()
 
-        self.dump_parent(self._("Wife"), family.get_mother_handle())
+        self.dump_parent(self._labels['Wife'], family.get_mother_handle())
 
         length = len(family.get_child_ref_list())
         if length > 0:
-            self.doc.start_paragraph("FGR-blank")
-            self.doc.end_paragraph()
-            self.doc.start_table('FGR-Children', 'FGR-ChildTable')
-            self.doc.start_row()
-            self.doc.start_cell('FGR-ParentHead', 4)
-            self.doc.start_paragraph('FGR-ParentName')
-            self.doc.write_text(self._("Children"))
-            self.doc.end_paragraph()
-            self.doc.end_cell()
-            self.doc.end_row()
+            doc.start_paragraph("FGR-blank")
+            doc.end_paragraph()
+            self._dump_children_header()
             index = 1
             for child_ref in family.get_child_ref_list():
                 self.dump_child(index, child_ref.ref)
                 index += 1
-            self.doc.end_table()
-
-        if self.recursive:
-            for child_ref in family.get_child_ref_list():
-                child = self.db.get_person_from_handle(child_ref.ref)
-                for child_family_handle in child.get_family_handle_list():
-                    if child_family_handle != family_handle:
-                        self.doc.page_break()
-                        self.dump_family(child_family_handle, (generation+1))
+            doc.end_table()
 
     def write_report(self):
+        # the filter preserves the order of the handles it is given, so
+        # it must be fed the sorted list to keep the output collated
         flist = self.db.get_family_handles(sort_handles=True,
                                            locale=self._locale)
         if not self.filter:
@@ -691,6 +818,8 @@ class FamilyGroupOptions(MenuReportOptions):
     Defines options and provides handling interface.
     """
 
+    _STYLE_CACHE = None
+
     def __init__(self, name, dbase):
         self.__db = dbase
         self.__fid = None
@@ -698,6 +827,7 @@ class FamilyGroupOptions(MenuReportOptions):
         self.__recursive = None
         self.__generations = None
         self._nf = None
+        self.__filters_cache = {}
         MenuReportOptions.__init__(self, name, dbase)
 
     def get_subject(self):
@@ -706,31 +836,31 @@ class FamilyGroupOptions(MenuReportOptions):
 
     def add_menu_options(self, menu):
 
+        menu_add = menu.add_option
+
         ##########################
         category_name = _("Report Options")
-        add_option = partial(menu.add_option, category_name)
         ##########################
 
         self.__filter = FilterOption(_("Filter"), 0)
         self.__filter.set_help(
             _("Select the filter to be applied to the report."))
-        add_option("filter", self.__filter)
+        menu_add(category_name, "filter", self.__filter)
         self.__filter.connect('value-changed', self.__filter_changed)
 
         self.__fid = FamilyOption(_("Center Family"))
         self.__fid.set_help(_("The center family for the filter"))
-        add_option("family_id", self.__fid)
+        menu_add(category_name, "family_id", self.__fid)
         self.__fid.connect('value-changed', self.__update_filters)
 
         self.__recursive = BooleanOption(_('Recursive (down)'), False)
         self.__recursive.set_help(_("Create reports for all descendants "
                                     "of this family."))
-        add_option("recursive", self.__recursive)
+        menu_add(category_name, "recursive", self.__recursive)
         self.__recursive.connect('value-changed', self.__recursive_changed)
 
         ##########################
         category_name = _("Report Options (2)")
-        add_option = partial(menu.add_option, category_name)
         ##########################
 
         self._nf = stdoptions.add_name_format_option(menu, category_name)
@@ -749,78 +879,50 @@ class FamilyGroupOptions(MenuReportOptions):
         stdoptions.add_date_format_option(menu, category_name, locale_opt)
 
         ##########################
-        add_option = partial(menu.add_option, _("Include"))
+        category_name = _("Include")
         ##########################
 
-        inc_par_mar = BooleanOption(_("Parent Marriage"), True)
-        inc_par_mar.set_help(
-            _("Whether to include marriage information for parents."))
-        add_option("incParMar", inc_par_mar)
-
-        inc_par_events = BooleanOption(_("Parent Events"), False)
-        inc_par_events.set_help(_("Whether to include events for parents."))
-        add_option("incParEvents", inc_par_events)
-
-        inc_par_addr = BooleanOption(_("Parent Addresses"), False)
-        inc_par_addr.set_help(_("Whether to include addresses for parents."))
-        add_option("incParAddr", inc_par_addr)
-
-        inc_par_notes = BooleanOption(_("Parent Notes"), False)
-        inc_par_notes.set_help(_("Whether to include notes for parents."))
-        add_option("incParNotes", inc_par_notes)
-
-        incattrs = BooleanOption(_("Parent Attributes"), False)
-        incattrs.set_help(_("Whether to include attributes."))
-        add_option("incattrs", incattrs)
-
-        inc_par_names = BooleanOption(_("Alternate Parent Names"), False)
-        inc_par_names.set_help(
-            _("Whether to include alternate names for parents."))
-        add_option("incParNames", inc_par_names)
+        for name, label, help_text, default in _INCLUDE_OPTIONS:
+            option = BooleanOption(_(label), default)
+            option.set_help(_(help_text))
+            menu_add(category_name, name, option)
 
         ##########################
         category_name = _("Include (2)")
-        add_option = partial(menu.add_option, category_name)
         ##########################
 
         stdoptions.add_gramps_id_option(menu, category_name)
 
-        inc_fam_notes = BooleanOption(_("Family Notes"), False)
-        inc_fam_notes.set_help(_("Whether to include notes for families."))
-        add_option("incFamNotes", inc_fam_notes)
-
-        inc_rel_dates = BooleanOption(_("Dates of Relatives"), False)
-        inc_rel_dates.set_help(_("Whether to include dates for relatives "
-                                 "(father, mother, spouse)."))
-        add_option("incRelDates", inc_rel_dates)
-
-        inc_chi_mar = BooleanOption(_("Children Marriages"), True)
-        inc_chi_mar.set_help(
-            _("Whether to include marriage information for children."))
-        add_option("incChiMar", inc_chi_mar)
+        for name, label, help_text, default in _INCLUDE_2_OPTIONS:
+            option = BooleanOption(_(label), default)
+            option.set_help(_(help_text))
+            menu_add(category_name, name, option)
 
         self.__generations = BooleanOption(_("Generation numbers "
                                              "(recursive only)"), False)
         self.__generations.set_help(_("Whether to include the generation "
                                       "on each report (recursive only)."))
-        add_option("generations", self.__generations)
+        menu_add(category_name, "generations", self.__generations)
 
         missinginfo = BooleanOption(_("Print fields for missing "
                                       "information"), True)
         missinginfo.set_help(_("Whether to include fields for missing "
                                "information."))
-        add_option("missinginfo", missinginfo)
+        menu_add(category_name, "missinginfo", missinginfo)
 
     def __update_filters(self):
         """
         Update the filter list based on the selected family
         """
         fid = self.__fid.get_value()
-        family = self.__db.get_family_from_gramps_id(fid)
         nfv = self._nf.get_value()
-        filter_list = utils.get_family_filters(self.__db, family,
-                                               include_single=True,
-                                               name_format=nfv)
+        filter_list = self.__filters_cache.get((fid, nfv))
+        if filter_list is None:
+            family = self.__db.get_family_from_gramps_id(fid)
+            filter_list = utils.get_family_filters(self.__db, family,
+                                                   include_single=True,
+                                                   name_format=nfv)
+            self.__filters_cache[(fid, nfv)] = filter_list
         self.__filter.set_filters(filter_list)
 
     def __filter_changed(self):
@@ -851,64 +953,85 @@ class FamilyGroupOptions(MenuReportOptions):
 
     def make_default_style(self, default_style):
         """Make default output style for the Family Group Report."""
-        para = ParagraphStyle()
+        # The style objects are constant, so build them only once and
+        # replay them into each style sheet.  The add_*_style methods
+        # copy their argument, so sharing the cached objects is safe.
+        if FamilyGroupOptions._STYLE_CACHE is None:
+            FamilyGroupOptions._STYLE_CACHE = self.__build_styles()
+        paragraphs, cells, tables = FamilyGroupOptions._STYLE_CACHE
+        default_style.add_paragraph_styles(paragraphs)
+        default_style.add_cell_styles(cells)
+        default_style.add_table_styles(tables)
+
+    @staticmethod
+    def __build_styles():
+        """Build the style objects for the default style sheet."""
+        paragraphs = []
+        cells = []
+        tables = []
+
+        # Fonts -- each distinct font is built once;
+        # ParagraphStyle.set_font copies its argument, so the font
+        # objects can be shared between paragraph styles
+        blank4 = FontStyle()
+        blank4.set_size(4)
+
+        serif10 = FontStyle()
+        serif10.set_type_face(FONT_SERIF)
+        serif10.set_size(10)
+        serif10.set_bold(0)
+
+        sans10b = FontStyle()
+        sans10b.set_type_face(FONT_SANS_SERIF)
+        sans10b.set_size(10)
+        sans10b.set_bold(1)
+
+        sans12b = FontStyle()
+        sans12b.set_type_face(FONT_SANS_SERIF)
+        sans12b.set_size(12)
+        sans12b.set_bold(1)
+
+        sans16b = FontStyle()
+        sans16b.set_type_face(FONT_SANS_SERIF)
+        sans16b.set_size(16)
+        sans16b.set_bold(1)
+
         #Paragraph Styles
-        font = FontStyle()
-        font.set_size(4)
-        para.set_font(font)
-        default_style.add_paragraph_style('FGR-blank', para)
-
-        font = FontStyle()
-        font.set_type_face(FONT_SANS_SERIF)
-        font.set_size(16)
-        font.set_bold(1)
         para = ParagraphStyle()
-        para.set_font(font)
+        para.set_font(blank4)
+        paragraphs.append(('FGR-blank', para))
+
+        para = ParagraphStyle()
+        para.set_font(sans16b)
         para.set_alignment(PARA_ALIGN_CENTER)
         para.set_header_level(1)
         para.set_description(_("The style used for the title."))
-        default_style.add_paragraph_style('FGR-Title', para)
+        paragraphs.append(('FGR-Title', para))
 
-        font = FontStyle()
-        font.set_type_face(FONT_SERIF)
-        font.set_size(10)
-        font.set_bold(0)
         para = ParagraphStyle()
-        para.set_font(font)
+        para.set_font(serif10)
         para.set_description(_('The basic style used for the text display.'))
-        default_style.add_paragraph_style('FGR-Normal', para)
+        paragraphs.append(('FGR-Normal', para))
 
         para = ParagraphStyle()
-        font = FontStyle()
-        font.set_type_face(FONT_SERIF)
-        font.set_size(10)
-        font.set_bold(0)
-        para.set_font(font)
+        para.set_font(serif10)
         para.set(lmargin=0.0)
         para.set_top_margin(0.0)
         para.set_bottom_margin(0.0)
         para.set_description(_('The basic style used for the note display.'))
-        default_style.add_paragraph_style("FGR-Note", para)
+        paragraphs.append(("FGR-Note", para))
 
-        font = FontStyle()
-        font.set_type_face(FONT_SANS_SERIF)
-        font.set_size(10)
-        font.set_bold(1)
         para = ParagraphStyle()
-        para.set_font(font)
+        para.set_font(sans10b)
         para.set_description(
             _('The style used for the text related to the children.'))
-        default_style.add_paragraph_style('FGR-ChildText', para)
+        paragraphs.append(('FGR-ChildText', para))
 
-        font = FontStyle()
-        font.set_type_face(FONT_SANS_SERIF)
-        font.set_size(12)
-        font.set_bold(1)
         para = ParagraphStyle()
-        para.set_font(font)
+        para.set_font(sans12b)
         para.set_header_level(3)
         para.set_description(_("The style used for the parent's name"))
-        default_style.add_paragraph_style('FGR-ParentName', para)
+        paragraphs.append(('FGR-ParentName', para))
 
         #Table Styles
         cell = TableCellStyle()
@@ -917,14 +1040,14 @@ class FamilyGroupOptions(MenuReportOptions):
         cell.set_bottom_border(1)
         cell.set_right_border(1)
         cell.set_left_border(1)
-        default_style.add_cell_style('FGR-ParentHead', cell)
+        cells.append(('FGR-ParentHead', cell))
 
         cell = TableCellStyle()
         cell.set_padding(0.1)
         cell.set_bottom_border(1)
         cell.set_left_border(1)
         cell.set_right_border(1) # for RTL
-        default_style.add_cell_style('FGR-TextContents', cell)
+        cells.append(('FGR-TextContents', cell))
 
         cell = TableCellStyle()
         cell.set_padding(0.1)
@@ -932,7 +1055,7 @@ class FamilyGroupOptions(MenuReportOptions):
         cell.set_left_border(1)
         cell.set_right_border(1) # for RTL
         cell.set_padding(0.1)
-        default_style.add_cell_style('FGR-TextChild1', cell)
+        cells.append(('FGR-TextChild1', cell))
 
         cell = TableCellStyle()
         cell.set_padding(0.1)
@@ -940,21 +1063,21 @@ class FamilyGroupOptions(MenuReportOptions):
         cell.set_left_border(1)
         cell.set_right_border(1) # for RTL
         cell.set_padding(0.1)
-        default_style.add_cell_style('FGR-TextChild2', cell)
+        cells.append(('FGR-TextChild2', cell))
 
         cell = TableCellStyle()
         cell.set_padding(0.1)
         cell.set_bottom_border(1)
         cell.set_right_border(1)
         cell.set_left_border(1)
-        default_style.add_cell_style('FGR-TextContentsEnd', cell)
+        cells.append(('FGR-TextContentsEnd', cell))
 
         cell = TableCellStyle()
         cell.set_padding(0.2)
         cell.set_bottom_border(1)
         cell.set_right_border(1)
         cell.set_left_border(1)
-        default_style.add_cell_style('FGR-ChildName', cell)
+        cells.append(('FGR-ChildName', cell))
 
         table = TableStyle()
         table.set_width(100)
@@ -962,7 +1085,7 @@ class FamilyGroupOptions(MenuReportOptions):
         table.set_column_width(0, 20)
         table.set_column_width(1, 40)
         table.set_column_width(2, 40)
-        default_style.add_table_style('FGR-ParentTable', table)
+        tables.append(('FGR-ParentTable', table))
 
         table = TableStyle()
         table.set_width(100)
@@ -971,4 +1094,6 @@ class FamilyGroupOptions(MenuReportOptions):
         table.set_column_width(1, 18)
         table.set_column_width(2, 35)
         table.set_column_width(3, 40)
-        default_style.add_table_style('FGR-ChildTable', table)
+        tables.append(('FGR-ChildTable', table))
+
+        return (paragraphs, cells, tables)